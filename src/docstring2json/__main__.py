@@ -1,6 +1,7 @@
 """Main entry point for the docstring to JSON converter."""
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -17,9 +18,6 @@ sys.path.insert(0, str(parent_dir))
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-from docstring2json.converter import file_to_json
-from docstring2json.utils.shared import process_package
-
 
 def main() -> None:
     """Main entry point."""
@@ -27,14 +25,29 @@ def main() -> None:
     parser.add_argument("--package-name", required=True, help="Name of the package to process")
     parser.add_argument("--output-dir", required=True, help="Directory to write output files")
     parser.add_argument("--exclude-private", action="store_true", help="Exclude private members")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output instead of writing it compactly")
+    parser.add_argument("--cache-dir", help="Directory for caching member data between runs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes converting modules in parallel (default: 1)",
+    )
     args = parser.parse_args()
 
+    # Import the converter only after parsing arguments, so --help and usage errors return immediately
+    from docstring2json.converter import file_to_json
+    from docstring2json.utils.shared import process_package
+
+    cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else None
+
     # Call process_package with arguments as a dictionary
     process_package(
         package_name=args.package_name,
         output_dir=Path(args.output_dir),
-        converter_func=file_to_json,
+        converter_func=functools.partial(file_to_json, pretty=args.pretty, cache_dir=cache_dir),
         exclude_private=args.exclude_private,
+        workers=args.workers,
     )
 
 
@@ -4,13 +4,20 @@ This module provides functions to convert Python classes and functions with Goog
 docstrings into TSX documentation components that use imported React components.
 """
 
+import ast
+import functools
+import hashlib
 import inspect
 import json
+import linecache
 import logging
+import os
 import sys
 from collections.abc import Callable, Mapping, Sequence
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from types import ModuleType
+from types import FunctionType, ModuleType
 from typing import Any, TypeVar, cast
 
 # Add the project root directory to sys.path
@@ -23,7 +30,7 @@ sys.path.insert(0, str(parent_dir))
 
 from google_docstring_parser import parse_google_docstring
 
-from docstring2json.utils.signature_formatter import format_signature, get_signature_params
+from docstring2json.utils.signature_formatter import Parameter, format_signature, get_signature, get_signature_params
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,6 +41,9 @@ GetSignatureParamsType = Callable[[type | Callable[..., Any]], list[Any]]
 
 # Error messages
 ERR_EXPECTED_DICT = "Expected dict result from convert_to_serializable"
+ERR_SOURCE_NOT_AVAILABLE = "source code not available"
+ERR_NO_SOURCE = "could not get source code"
+ERR_CLASS_NOT_FOUND = "could not find class definition"
 
 
 # Type definitions
@@ -41,6 +51,15 @@ T = TypeVar("T")
 JSONSerializable = str | int | float | bool | None | dict[str, "JSONSerializable"] | list["JSONSerializable"]
 ComplexObject = JSONSerializable | object | Mapping[str | object, Any] | Sequence[Any]
 
+# Memoized docstring parser: identical docstrings (re-exports, shared base classes) are parsed once
+_parse_docstring = functools.lru_cache(maxsize=4096)(parse_google_docstring)
+
+# Distributions whose versions are part of every on-disk cache key
+CACHE_KEY_DISTRIBUTIONS = ("docstring2json", "google-docstring-parser")
+
+# Default values whose repr is the same in every process, so it can go into a cache key as-is
+_STABLE_DEFAULT_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
 
 def collect_module_members(module: ModuleType) -> tuple[list[tuple[str, type]], list[tuple[str, Callable[..., Any]]]]:
     """Collect classes and functions from a module.
@@ -55,19 +74,101 @@ def collect_module_members(module: ModuleType) -> tuple[list[tuple[str, type]],
     classes: list[tuple[str, type]] = []
     functions: list[tuple[str, Callable[..., Any]]] = []
 
-    for name, obj in inspect.getmembers(module):
+    module_name = module.__name__
+
+    for name, obj in vars(module).items():
         # Skip private members and imported objects
-        if name.startswith("_") or inspect.getmodule(obj) != inspect.getmodule(module):
+        if name.startswith("_") or getattr(obj, "__module__", None) != module_name:
             continue
 
-        if inspect.isclass(obj):
+        if isinstance(obj, type):
             classes.append((name, obj))
-        elif inspect.isfunction(obj):
+        elif isinstance(obj, FunctionType):
             functions.append((name, obj))
 
+    # Keep members in alphabetical order, as inspect.getmembers returned them
+    classes.sort(key=itemgetter(0))
+    functions.sort(key=itemgetter(0))
+
     return classes, functions
 
 
+class _ClassLineFinder(ast.NodeVisitor):
+    """Record the first source line of every class definition in a module.
+
+    Mirrors the qualified-name bookkeeping of ``inspect._ClassFinder``, but indexes all
+    classes in a single pass instead of re-walking the tree for every lookup.
+    """
+
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.line_numbers: dict[str, int] = {}
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:  # noqa: N802
+        self.stack.extend((node.name, "<locals>"))
+        self.generic_visit(node)
+        del self.stack[-2:]
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        self.stack.append(node.name)
+        # Start at the first decorator, as inspect does; keep the first definition of a qualname
+        first_line = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+        self.line_numbers.setdefault(".".join(self.stack), first_line - 1)
+        self.generic_visit(node)
+        self.stack.pop()
+
+
+@functools.lru_cache(maxsize=256)
+def _class_line_numbers(source: str) -> dict[str, int]:
+    """Map class qualified names to zero-based start lines for a module's source.
+
+    Args:
+        source: Full source text of a module
+
+    Returns:
+        dict[str, int]: Start line of each class definition, keyed by qualified name
+    """
+    finder = _ClassLineFinder()
+    finder.visit(ast.parse(source))
+    return finder.line_numbers
+
+
+def _get_class_source(cls: type) -> str:
+    """Get the source code of a class, parsing each source file only once.
+
+    Before Python 3.13, ``inspect.getsource`` re-parses the whole file for every class
+    it is asked about. This follows the same lookup but shares one parse per file.
+
+    Args:
+        cls: Class to get source code for
+
+    Returns:
+        str: Source code of the class
+
+    Raises:
+        OSError: If the source code cannot be found
+    """
+    file = inspect.getsourcefile(cls)
+    if file:
+        linecache.checkcache(file)
+    else:
+        file = inspect.getfile(cls)
+        if not (file.startswith("<") and file.endswith(">")):
+            raise OSError(ERR_SOURCE_NOT_AVAILABLE)
+
+    module = inspect.getmodule(cls, file)
+    lines = linecache.getlines(file, module.__dict__ if module else None)
+    if not lines:
+        raise OSError(ERR_NO_SOURCE)
+
+    line_number = _class_line_numbers("".join(lines)).get(cls.__qualname__)
+    if line_number is None:
+        raise OSError(ERR_CLASS_NOT_FOUND)
+    return "".join(inspect.getblock(lines[line_number:]))
+
+
 def get_source_code(obj: type | Callable[..., Any]) -> str | None:
     """Get source code for a class or function.
 
@@ -78,30 +179,60 @@ def get_source_code(obj: type | Callable[..., Any]) -> str | None:
         str | None: Source code as string or None if not available
     """
     try:
-        import inspect
-
+        if isinstance(obj, type) and sys.version_info < (3, 13):  # 3.13+ classes record __firstlineno__
+            return _get_class_source(obj)
         return inspect.getsource(obj)
     except (TypeError, OSError):
         return None
 
 
-def sanitize_for_json(data: ComplexObject) -> JSONSerializable:
-    """Convert complex Python objects to JSON-compatible types.
+def json_default(obj: object) -> str:
+    """Convert an object that the JSON encoder does not support to a string.
 
     Args:
-        data: Data to convert to JSON-serializable format
+        obj: Object that is not natively JSON-serializable
 
     Returns:
-        JSONSerializable: JSON-compatible data
+        str: Class name for types, string representation for anything else
     """
-    if isinstance(data, (str, int, float, bool, type(None))):
-        return data
-    if isinstance(data, dict):
-        return {str(k): sanitize_for_json(v) for k, v in data.items()}
-    if isinstance(data, (list, tuple)):
-        return [sanitize_for_json(item) for item in data]
+    return obj.__name__ if isinstance(obj, type) else str(obj)
 
-    return data.__name__ if isinstance(data, type) else str(data)
+
+def get_annotation_name(annotation: object) -> str:
+    """Get the display name of a type annotation.
+
+    Args:
+        annotation: Annotation taken from an inspect.Parameter
+
+    Returns:
+        str: The annotation's __name__ if it has one, otherwise its string representation
+    """
+    return getattr(annotation, "__name__", None) or str(annotation)
+
+
+def get_parsed_docstring(obj: type | Callable[..., Any]) -> dict[str, Any]:
+    """Get the parsed Google-style docstring of a class or function.
+
+    Docstring text is parsed through a memoized parser, so identical docstrings
+    are only parsed once.
+
+    Args:
+        obj: Class or function whose docstring should be parsed
+
+    Returns:
+        dict[str, Any]: Parsed docstring sections, or an empty dict if parsing failed
+    """
+    docstring = obj.__doc__
+    parsed: dict[str, Any] = {}
+    # Objects without a docstring, or with a blank one, skip the parser entirely
+    if docstring and not docstring.isspace():
+        try:
+            parsed = _parse_docstring(docstring)
+        except Exception:  # noqa: BLE001
+            # Tracebacks are only attached when debugging; a run can hit many bad docstrings
+            logger.warning("Error parsing docstring for %s", docstring, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+    return parsed
 
 
 def get_class_ancestors(cls: type) -> list[str]:
@@ -117,7 +248,7 @@ def get_class_ancestors(cls: type) -> list[str]:
     return [base.__name__ for base in cls.__mro__[1:] if base.__name__ != "object"]
 
 
-def class_to_data(obj: type | Callable[..., Any]) -> dict[str, Any]:
+def class_to_data(obj: type | Callable[..., Any], *, source_code: str | None = None) -> dict[str, Any]:
     """Convert class or function to structured data format.
 
     This function extracts documentation data for a class or function from
@@ -125,69 +256,67 @@ def class_to_data(obj: type | Callable[..., Any]) -> dict[str, Any]:
 
     Args:
         obj: Class or function to document
+        source_code: Source code of the object if the caller has already read it.
+            If None, it is looked up here
 
     Returns:
         dict[str, Any]: Dictionary containing structured documentation data
     """
-    # Get object name and parameters
     obj_name = obj.__name__
-    params = get_signature_params(obj)
-    # Get signature data
-    signature_data = format_signature(obj, params)
-    # Get source code only
-    source_code = get_source_code(obj)
-
-    # Parse docstring
-    docstring = obj.__doc__ or ""
-    try:
-        parsed = parse_google_docstring(docstring)
-    except Exception:
-        logger.exception("Error parsing docstring for %s", docstring)
-        parsed = {}
+    is_class = isinstance(obj, type)
 
-    # Try to extract parameter information, but handle cases where signature isn't available
+    # Compute the signature once and extract parameter information from it,
+    # handling cases where the signature isn't available
     signature_params = []
+    params: list[Parameter] | None = None
     try:
-        if not isinstance(obj, type) or hasattr(obj, "__init__"):
-            sig = inspect.signature(obj)
+        if not is_class or hasattr(obj, "__init__"):
+            signature: inspect.Signature = get_signature(obj)
+            # Bind loop invariants to locals
+            empty = inspect.Parameter.empty
+            variadic_kinds = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
             signature_params = [
                 {
                     "name": param.name,
-                    "type": param.annotation.__name__
-                    if param.annotation != inspect.Parameter.empty and hasattr(param.annotation, "__name__")
-                    else str(param.annotation)
-                    if param.annotation != inspect.Parameter.empty
-                    else "Any",
-                    "default": str(param.default) if param.default != inspect.Parameter.empty else None,
+                    "type": get_annotation_name(param.annotation) if param.annotation is not empty else "Any",
+                    "default": str(param.default) if param.default is not empty else None,
                 }
-                for param in sig.parameters.values()
-                if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+                for param in signature.parameters.values()
+                if param.kind not in variadic_kinds
             ]
+            # Reuse the signature for a function's parameters; classes take theirs from __init__
+            params = get_signature_params(obj, signature=None if is_class else signature)
     except (ValueError, TypeError):
         logger.warning("Could not extract signature for %s", obj_name)
 
+    # Get parameters, unless they were already extracted from the signature above
+    if params is None:
+        params = get_signature_params(obj)
+    # Get signature data
+    signature_data = format_signature(obj, params)
+    # Get source code only, unless the caller already has it
+    if source_code is None:
+        source_code = get_source_code(obj)
+
+    # Parse docstring
+    parsed = get_parsed_docstring(obj)
+
     # Create the data structure
     member_data: dict[str, Any] = {
         "name": obj_name,
-        "type": "class" if isinstance(obj, type) else "function",
+        "type": "class" if is_class else "function",
         "signature": {
             "params": signature_params,
         },
         "docstring": parsed,
     }
 
-    # Add return_type only for functions
-    if not isinstance(obj, type):
-        member_data["signature"]["return_type"] = (
-            signature_data.return_type.__name__
-            if signature_data.return_type is not None and hasattr(signature_data.return_type, "__name__")
-            else str(signature_data.return_type)
-            if signature_data.return_type is not None
-            else None
-        )
     # Add ancestors list only for classes
+    if is_class:
+        member_data["ancestors"] = get_class_ancestors(cast("type", obj))
+    # Add return_type only for functions; format_signature has already turned it into a display string
     else:
-        member_data["ancestors"] = get_class_ancestors(obj)
+        member_data["signature"]["return_type"] = signature_data.return_type
 
     # Add source code if available
     if source_code:
@@ -196,18 +325,30 @@ def class_to_data(obj: type | Callable[..., Any]) -> dict[str, Any]:
     return member_data
 
 
-def serialize_module_data(data: ComplexObject, module_name: str) -> str:
+def serialize_module_data(
+    data: ComplexObject,
+    module_name: str,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: int | None = None,
+) -> str:
     """Serialize module data to JSON with fallback handling.
 
     Args:
         data: The module data to serialize
         module_name: The name of the module for fallback data
+        default: Function called by the JSON encoder for objects it cannot serialize.
+            If None, such objects make serialization fall back to the error data
+        indent: Indentation for pretty-printed output. If None, compact JSON without
+            whitespace is produced
 
     Returns:
         str: JSON string representation of the data
     """
+    # Compact separators drop all optional whitespace when not pretty-printing
+    separators = (",", ":") if indent is None else None
     try:
-        return json.dumps(data, indent=2)
+        return json.dumps(data, indent=indent, separators=separators, default=default)
     except TypeError:
         logger.exception("Error serializing data to JSON, data may contain non-serializable types")
         fallback_data = {
@@ -216,34 +357,193 @@ def serialize_module_data(data: ComplexObject, module_name: str) -> str:
             "members": [],
         }
         try:
-            return json.dumps(fallback_data, indent=2)
+            return json.dumps(fallback_data, indent=indent, separators=separators)
         except TypeError:
             # Ultimate fallback - handle even if the mock json.dumps always raises an error
             return f"{{ moduleName: '{module_name}', docstring: 'Error serializing module data', members: [] }}"
 
 
-def process_member(obj: type | Callable[..., Any]) -> dict[str, Any] | None:
+@functools.cache
+def _distribution_versions() -> str:
+    """Get the installed versions of the distributions that shape member data.
+
+    Returns:
+        str: Comma-separated versions, with empty entries for distributions that are not installed
+    """
+    # Only needed when caching on disk, and slow to import, so keep it out of module import time
+    import importlib.metadata
+
+    versions = []
+    for distribution in CACHE_KEY_DISTRIBUTIONS:
+        try:
+            versions.append(importlib.metadata.version(distribution))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append("")
+    return ",".join(versions)
+
+
+@functools.cache
+def _converter_source_digest() -> str:
+    """Hash the source of the modules that build member data.
+
+    A source checkout reports no installed version, so without this, edits to the
+    converter would not invalidate entries cached by the previous code.
+
+    Returns:
+        str: Hex digest of the converter and signature formatter source, or an empty
+            string if the source is not available
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        for module_name in (__name__, format_signature.__module__):
+            digest.update(inspect.getsource(sys.modules[module_name]).encode("utf-8"))
+    except (OSError, TypeError):
+        return ""
+    return digest.hexdigest()
+
+
+def _stable_signature(obj: type | Callable[..., Any]) -> str:
+    """Describe the signature of a class or function the same way in every process.
+
+    str(signature) embeds repr() of the default values, and for functions and most other
+    objects that repr contains a memory address that changes between runs. Such defaults
+    are described by their type instead.
+
+    Args:
+        obj: Class or function whose signature should be described
+
+    Returns:
+        str: Parameter names, kinds, annotations and defaults, plus the return annotation,
+            or an empty string if the object has no signature
+    """
+    try:
+        signature = get_signature(obj)
+    except (ValueError, TypeError):
+        return ""
+
+    empty = inspect.Parameter.empty
+    parts = []
+    for param in signature.parameters.values():
+        annotation = inspect.formatannotation(param.annotation) if param.annotation is not empty else ""
+        if param.default is empty:
+            default = ""
+        elif isinstance(param.default, _STABLE_DEFAULT_TYPES):
+            default = repr(param.default)
+        else:
+            default = type(param.default).__qualname__
+        parts.append(f"{param.name}:{param.kind.name}:{annotation}={default}")
+
+    return_annotation = signature.return_annotation
+    parts.append(inspect.formatannotation(return_annotation) if return_annotation is not empty else "")
+    return ",".join(parts)
+
+
+def get_member_cache_key(obj: type | Callable[..., Any], *, source_code: str | None = None) -> str | None:
+    """Build the on-disk cache key for a class or function.
+
+    The key covers everything class_to_data reads: the qualified name, source code,
+    docstring, signature and, for classes, the ancestors, plus the versions of this
+    tool and of the docstring parser and a hash of the converter source.
+
+    Args:
+        obj: Class or function to build the key for
+        source_code: Source code of the object if the caller has already read it.
+            If None, it is looked up here
+
+    Returns:
+        str | None: Hex digest identifying the member data, or None if the source code
+            is not available and the object cannot be cached reliably
+    """
+    if source_code is None:
+        source_code = get_source_code(obj)
+    if source_code is None:
+        return None
+
+    ancestors = ",".join(get_class_ancestors(obj)) if isinstance(obj, type) else ""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        _distribution_versions(),
+        _converter_source_digest(),
+        obj.__module__,
+        obj.__qualname__,
+        _stable_signature(obj),
+        ancestors,
+        obj.__doc__ or "",
+        source_code,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cached_class_to_data(obj: type | Callable[..., Any], cache_dir: Path) -> dict[str, Any]:
+    """Convert class or function to structured data, reusing results stored on disk.
+
+    Args:
+        obj: Class or function to document
+        cache_dir: Directory holding cached member data from previous runs
+
+    Returns:
+        dict[str, Any]: Dictionary containing structured documentation data
+    """
+    # Read the source once: it is part of both the cache key and the member data
+    source_code = get_source_code(obj)
+    cache_key = None if source_code is None else get_member_cache_key(obj, source_code=source_code)
+    if cache_key is None:
+        return class_to_data(obj)
+
+    cache_file = cache_dir / f"{cache_key}.json"
+    try:
+        return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    member_data = class_to_data(obj, source_code=source_code)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        temp_file = cache_file.with_name(f"{cache_key}.{os.getpid()}.tmp")
+        temp_file.write_bytes(json.dumps(member_data, separators=(",", ":"), default=json_default).encode("utf-8"))
+        temp_file.replace(cache_file)
+    except (OSError, TypeError):
+        logger.warning("Could not write cache entry for %s", obj.__name__)
+    return member_data
+
+
+def process_member(obj: type | Callable[..., Any], *, cache_dir: Path | None = None) -> dict[str, Any] | None:
     """Process a class or function member to extract documentation.
 
     Args:
         obj: The class or function to process
+        cache_dir: Directory for caching member data across runs. If None, nothing is cached on disk
 
     Returns:
         dict[str, Any] | None: The processed member data or None if processing failed
     """
     try:
+        if cache_dir is not None:
+            return cached_class_to_data(obj, cache_dir)
         return class_to_data(obj)
-    except Exception:
-        logger.exception("Failed to process member %s", obj.__name__)
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to process member %s", obj.__name__, exc_info=logger.isEnabledFor(logging.DEBUG))
         return None
 
 
-def file_to_json(module: ModuleType, module_name: str) -> str:
+def file_to_json(
+    module: ModuleType,
+    module_name: str,
+    *,
+    pretty: bool = False,
+    cache_dir: Path | None = None,
+) -> str:
     """Convert a module to a JSON document with just the data.
 
     Args:
         module: The module object to document
         module_name: Name of the module for the heading
+        pretty: Whether to indent the JSON output for readability instead of writing it compactly
+        cache_dir: Directory for caching member data across runs. If None, nothing is cached on disk
 
     Returns:
         str: The JSON content
@@ -259,20 +559,20 @@ def file_to_json(module: ModuleType, module_name: str) -> str:
     classes, functions = collect_module_members(module)
     members_data: list[dict[str, Any]] = []
 
-    # Process classes and functions using the helper
-    for _name, class_obj in classes:
-        member_data = process_member(class_obj)
-        if member_data:
-            members_data.append(member_data)
+    # Process classes and functions using the helper, skipping aliases of objects already emitted
+    emitted: set[int] = set()
+    members: chain[tuple[str, type | Callable[..., Any]]] = chain(classes, functions)
+    for _name, member_obj in members:
+        if id(member_obj) in emitted:
+            continue
+        emitted.add(id(member_obj))
 
-    for _name, func_obj in functions:
-        member_data = process_member(func_obj)
+        member_data = process_member(member_obj, cache_dir=cache_dir)
         if member_data:
             members_data.append(member_data)
 
     # Add members to module data
     module_data["members"] = cast("Any", members_data)
 
-    # Sanitize data and convert to JSON
-    sanitized_data = sanitize_for_json(module_data)
-    return serialize_module_data(sanitized_data, module_name)
+    # Convert to JSON, stringifying any values the encoder does not support natively
+    return serialize_module_data(module_data, module_name, default=json_default, indent=2 if pretty else None)
@@ -6,9 +6,11 @@ This module contains functions that are used in JSON converter.
 import importlib
 import inspect
 import logging
+import multiprocessing
 import pkgutil
 import re
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from types import ModuleType
 from typing import TypeVar
@@ -22,6 +24,9 @@ T = TypeVar("T")
 # Error messages
 ERR_NO_FILE_ATTR = "Package has no __file__ attribute"
 
+# Characters that are not allowed in anchor IDs
+_ANCHOR_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+
 
 def normalize_anchor_id(text: str) -> str:
     """Normalize text for use as an anchor ID.
@@ -34,7 +39,7 @@ def normalize_anchor_id(text: str) -> str:
             and spaces replaced with hyphens
     """
     # Remove special characters and replace spaces with hyphens
-    return re.sub(r"[^a-zA-Z0-9\s-]", "", text).strip().lower().replace(" ", "-")
+    return _ANCHOR_RE.sub("", text).strip().lower().replace(" ", "-")
 
 
 def get_package_structure(package_name: str) -> dict[str, Path]:
@@ -63,29 +68,31 @@ def get_package_structure(package_name: str) -> dict[str, Path]:
     # Store module paths
     module_paths: dict[str, Path] = {}
 
-    def process_module(module: ModuleType, module_name: str) -> None:
-        """Process a module and its submodules."""
+    def add_module_path(module: ModuleType, module_name: str) -> None:
+        """Record the path of a module relative to the package directory."""
         try:
             # Get the module's file
             file_path = Path(inspect.getfile(module))
             # Get relative path from package directory
-            relative_path = file_path.relative_to(package_dir)
-            module_paths[module_name] = relative_path
-
-            # Process submodules
-            if hasattr(module, "__path__"):
-                for _, submodule_name, _is_pkg in pkgutil.iter_modules(module.__path__, f"{module_name}."):
-                    try:
-                        submodule = importlib.import_module(submodule_name)
-                        process_module(submodule, submodule_name)
-                    except (ImportError, AttributeError):
-                        continue
+            module_paths[module_name] = file_path.relative_to(package_dir)
         except (TypeError, ValueError):
             # Skip modules without source files
             pass
 
-    # Process the package and all its submodules
-    process_module(package, package_name)
+    def on_walk_error(module_name: str) -> None:
+        """Log subpackages that walk_packages could not import."""
+        logger.debug("Failed to import %s", module_name)
+
+    # Process the package and all its submodules in a single walk
+    add_module_path(package, package_name)
+    if hasattr(package, "__path__"):
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package_name}.", onerror=on_walk_error):
+            try:
+                submodule = importlib.import_module(module_info.name)
+            except (ImportError, AttributeError):
+                continue
+            add_module_path(submodule, module_info.name)
+
     return module_paths
 
 
@@ -132,34 +139,74 @@ def process_module(
         logger.exception("Failed to process module %s", module_name)
 
 
+def _configure_worker_logging(level: int) -> None:
+    """Set up logging in a worker process the same way as in the parent.
+
+    Spawned workers do not run the parent's logging configuration, so without this
+    their records would go through the last-resort handler without level or logger name.
+
+    Args:
+        level: Level of the parent process's root logger
+    """
+    logging.basicConfig(level=level)
+
+
 def process_package(
     package_name: str,
     output_dir: Path,
     converter_func: Callable[[ModuleType, str], str],
     exclude_private: bool = False,
+    workers: int = 1,
 ) -> None:
     """Process an installed package and generate documentation.
 
     Args:
         package_name: Name of the package
         output_dir: Directory to write output files
-        converter_func: Function to convert module to JSON
+        converter_func: Function to convert module to JSON. Must be picklable when workers > 1
         exclude_private: Whether to exclude private members
+        workers: Number of worker processes converting modules in parallel. 1 processes
+            modules sequentially in the current process
     """
     # Get the package structure
     module_paths = get_package_structure(package_name)
 
     # Process each module with progress bar
     with tqdm(total=len(module_paths), desc=f"Processing {package_name}") as pbar:
-        for module_name, module_path in module_paths.items():
-            process_module(
-                module_name=module_name,
-                module_path=module_path,
-                output_dir=output_dir,
-                converter_func=converter_func,
-                exclude_private=exclude_private,
-            )
-            pbar.update(1)
+        if workers <= 1:
+            for module_name, module_path in module_paths.items():
+                process_module(
+                    module_name=module_name,
+                    module_path=module_path,
+                    output_dir=output_dir,
+                    converter_func=converter_func,
+                    exclude_private=exclude_private,
+                )
+                pbar.update(1)
+            return
+
+        # Modules are imported by name inside the workers, so only picklable arguments cross processes.
+        # Spawned workers start clean instead of forking while the progress bar's monitor thread runs.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_configure_worker_logging,
+            initargs=(logging.getLogger().level,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    process_module,
+                    module_name=module_name,
+                    module_path=module_path,
+                    output_dir=output_dir,
+                    converter_func=converter_func,
+                    exclude_private=exclude_private,
+                )
+                for module_name, module_path in module_paths.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+                pbar.update(1)
 
 
 def write_module_json(
@@ -182,7 +229,8 @@ def write_module_json(
     module_output_dir.mkdir(parents=True, exist_ok=True)
     content = converter_func(module, module_name)
     output_file = module_output_dir / "data.json"
-    output_file.write_text(content)
+    # Encode once and write the bytes directly, skipping the text I/O layer
+    output_file.write_bytes(content.encode("utf-8"))
 
 
 def build_output_dir(output_dir: Path, module_name: str, file_name: str) -> Path:
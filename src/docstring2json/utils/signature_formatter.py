@@ -4,6 +4,7 @@ This module provides functions for extracting and formatting function and class
 including parameter formatting and documentation.
 """
 
+import functools
 import inspect
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -29,6 +30,30 @@ class SignatureData:
     return_type: str | None = None
 
 
+# Memoized inspect.signature shared by the converter and get_signature_params
+_signature = functools.lru_cache(maxsize=2048)(inspect.signature)
+
+
+def get_signature(obj: Callable[..., Any]) -> inspect.Signature:
+    """Get the signature of a class or function, computing it once per hashable object.
+
+    Args:
+        obj: Class or function to inspect
+
+    Returns:
+        inspect.Signature: Signature of the object
+
+    Raises:
+        ValueError: If no signature can be provided for the object
+        TypeError: If the object type is not supported by inspect.signature
+    """
+    try:
+        return _signature(obj)
+    except TypeError:
+        # Unhashable objects (e.g. classes whose metaclass defines __eq__ without __hash__) bypass the cache
+        return inspect.signature(obj)
+
+
 def _get_param_type(param: inspect.Parameter) -> str:
     """Extract and format parameter type annotation.
 
@@ -93,23 +118,24 @@ def _process_signature_params(signature: inspect.Signature, *, skip_self: bool =
         list[Parameter]: List of Parameter objects containing name, type, and default value
             for each parameter in the signature
     """
-    params = []
-    for name, param in signature.parameters.items():
-        if skip_self and name == "self":
-            continue
-
-        param_type = _get_param_type(param)
-        default = _get_param_default(param)
-        params.append(Parameter(name=name, type=param_type, default=default))
-
-    return params
-
-
-def get_signature_params(obj: type | Callable[..., Any]) -> list[Parameter]:
+    return [
+        Parameter(name=name, type=_get_param_type(param), default=_get_param_default(param))
+        for name, param in signature.parameters.items()
+        if not (skip_self and name == "self")
+    ]
+
+
+def get_signature_params(
+    obj: type | Callable[..., Any],
+    *,
+    signature: inspect.Signature | None = None,
+) -> list[Parameter]:
     """Extract parameters from object signature.
 
     Args:
         obj: Class or function to extract parameters from
+        signature: Precomputed signature of a function to reuse instead of calling
+            inspect.signature again. Ignored for classes, whose parameters come from __init__
 
     Returns:
         list[Parameter]: List of Parameter objects containing name, type, and default value
@@ -128,14 +154,15 @@ def get_signature_params(obj: type | Callable[..., Any]) -> list[Parameter]:
                 init_method = inspect.getattr_static(obj, "__init__")
                 if not callable(init_method):
                     return []
-                signature = inspect.signature(init_method)
+                signature = get_signature(init_method)
                 return _process_signature_params(signature, skip_self=True)
             except (ValueError, TypeError):
                 # If __init__ is not found or has no signature, return empty list
                 return []
         else:
-            # For functions, get signature directly
-            signature = inspect.signature(obj)
+            # For functions, get signature directly unless the caller already has it
+            if signature is None:
+                signature = get_signature(obj)
             return _process_signature_params(signature)
     except (ValueError, TypeError):
         # Handle built-in types, Exception classes, or other types without a signature
@@ -170,9 +197,11 @@ def format_signature(obj: type | Callable[..., Any], params: list[Parameter]) ->
     """
     # Get return type for functions
     return_type = None
-    if inspect.isfunction(obj) and obj.__annotations__.get("return"):
-        return_type = obj.__annotations__["return"]
-        return_type = return_type.__name__ if hasattr(return_type, "__name__") else str(return_type)
+    if inspect.isfunction(obj):
+        # __annotations__ is a descriptor on functions, so read it once
+        return_annotation = obj.__annotations__.get("return")
+        if return_annotation:
+            return_type = getattr(return_annotation, "__name__", None) or str(return_annotation)
 
     return SignatureData(
         name=obj.__name__,
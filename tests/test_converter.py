@@ -1,13 +1,30 @@
 """Tests for the docstring_2tsx converter module."""
 
+import dataclasses
 import inspect
 from typing import Any, Callable
 import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from docstring2json.converter import class_to_data, serialize_module_data, process_member, get_class_ancestors
+from docstring2json.converter import (
+    get_source_code,
+    class_to_data,
+    get_annotation_name,
+    get_class_ancestors,
+    get_member_cache_key,
+    _parse_docstring,
+    get_parsed_docstring,
+    json_default,
+    process_member,
+    serialize_module_data,
+)
 
 
 class SimpleClass:
@@ -91,6 +108,39 @@ class MultipleInheritance(BaseClass, SimpleClass):
     pass
 
 
+@dataclasses.dataclass
+class DecoratedClass:
+    """Class whose source starts at its decorator."""
+
+    class Nested:
+        """Class nested inside another class."""
+
+    value: int = 0
+
+
+class EqualityMeta(type):
+    """Metaclass defining __eq__ without __hash__, which makes its classes unhashable."""
+
+    def __eq__(cls, other: object) -> bool:
+        return cls is other
+
+
+class UnhashableClass(metaclass=EqualityMeta):
+    """Class that cannot be used as a cache key."""
+
+    def __init__(self, value: int = 0):
+        self.value = value
+
+
+def make_local_class() -> type:
+    """Create a class whose qualified name contains <locals>."""
+
+    class LocalClass:
+        """Class defined inside a function."""
+
+    return LocalClass
+
+
 @pytest.mark.parametrize(
     "test_obj,expected_fields",
     [
@@ -287,6 +337,19 @@ def test_serialize_module_data_handles_unserializable_data():
         assert "members: []" in result
 
 
+def test_serialize_module_data_uses_default_for_unserializable_values():
+    """Test that serialize_module_data stringifies unsupported values when given a default."""
+    test_data = {
+        "moduleName": "test_module",
+        "members": [{"annotation": int, "default": SimpleClass("name")}],
+    }
+
+    parsed_result = json.loads(serialize_module_data(test_data, "test_module", default=json_default))
+
+    assert parsed_result["members"][0]["annotation"] == "int"
+    assert "SimpleClass" in parsed_result["members"][0]["default"]
+
+
 def test_process_member_handles_normal_class():
     """Test that process_member can handle a normal class."""
     result = process_member(SimpleClass)
@@ -317,6 +380,21 @@ def test_process_member_handles_errors():
         assert result is None
 
 
+@pytest.mark.parametrize("level,has_traceback", [(logging.WARNING, False), (logging.DEBUG, True)])
+def test_process_member_attaches_traceback_only_when_debugging(
+    caplog: pytest.LogCaptureFixture, level: int, has_traceback: bool
+):
+    """Test that failed members are logged as warnings, with the traceback only at DEBUG level."""
+    caplog.set_level(level, logger="docstring2json.converter")
+
+    with patch("docstring2json.converter.class_to_data", side_effect=ValueError("Test error")):
+        assert process_member(SimpleClass) is None
+
+    (record,) = [record for record in caplog.records if record.name == "docstring2json.converter"]
+    assert record.levelno == logging.WARNING
+    assert bool(record.exc_info) is has_traceback
+
+
 def test_get_class_ancestors():
     """Test the get_class_ancestors function."""
     # Basic inheritance
@@ -340,3 +418,116 @@ def test_class_to_data_includes_ancestors():
     # Test with a function (should not have ancestors)
     result = class_to_data(simple_function)
     assert "ancestors" not in result
+
+
+def test_get_parsed_docstring_shares_parse_for_identical_docstrings():
+    """Test that objects with the same docstring text share one parser call."""
+
+    def first_function():
+        """Docstring shared by two functions in the parse cache test."""
+
+    def second_function():
+        """Docstring shared by two functions in the parse cache test."""
+
+    hits_before = _parse_docstring.cache_info().hits
+
+    assert get_parsed_docstring(first_function) == get_parsed_docstring(second_function)
+    assert _parse_docstring.cache_info().hits == hits_before + 1
+
+
+def test_process_member_reuses_disk_cache(tmp_path: Path):
+    """Test that process_member reads member data back from the on-disk cache."""
+    first = process_member(simple_function, cache_dir=tmp_path)
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    with patch("docstring2json.converter.class_to_data", side_effect=AssertionError("cache miss")):
+        second = process_member(simple_function, cache_dir=tmp_path)
+
+    assert second == first
+
+
+@pytest.mark.parametrize(
+    "first_obj,second_obj,same_key",
+    [
+        (simple_function, simple_function, True),
+        (simple_function, function_without_docs, False),
+        (MiddleClass, ChildClass, False),
+    ],
+)
+def test_get_member_cache_key(first_obj: Any, second_obj: Any, same_key: bool):
+    """Test that cache keys are stable per object and differ between objects."""
+    assert (get_member_cache_key(first_obj) == get_member_cache_key(second_obj)) is same_key
+
+
+def test_get_member_cache_key_is_stable_across_processes():
+    """Test that the cache key does not depend on per-process details such as memory addresses."""
+    # MIMEAudio defaults _encoder to a function, whose repr includes its address
+    code = (
+        "from email.mime.audio import MIMEAudio\n"
+        "from docstring2json.converter import get_member_cache_key\n"
+        "print(get_member_cache_key(MIMEAudio))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    keys = [
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+        for _ in range(2)
+    ]
+
+    assert keys[0].strip()
+    assert keys[0] == keys[1]
+
+
+@pytest.mark.parametrize("docstring", [None, "", "   ", "\n    \n    "])
+def test_get_parsed_docstring_skips_parser_without_docstring(docstring: str | None):
+    """Test that objects with a missing or blank docstring are not passed to the parser."""
+
+    def undocumented_function():
+        pass
+
+    undocumented_function.__doc__ = docstring
+
+    with patch("docstring2json.converter._parse_docstring") as mock_parse:
+        assert get_parsed_docstring(undocumented_function) == {}
+
+    mock_parse.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "annotation,expected",
+    [
+        (int, "int"),
+        (list[str], "list"),
+        ("ForwardRef", "ForwardRef"),
+        (1, "1"),
+        (True, "True"),
+        (["unhashable"], "['unhashable']"),
+    ],
+)
+def test_get_annotation_name(annotation: Any, expected: str):
+    """Test formatting annotations, including unhashable ones."""
+    assert get_annotation_name(annotation) == expected
+
+
+def test_get_annotation_name_keeps_union_order():
+    """Test that equal unions with a different member order keep their own order."""
+    assert get_annotation_name(int | str) == "int | str"
+    assert get_annotation_name(str | int) == "str | int"
+
+
+@pytest.mark.parametrize(
+    "test_obj",
+    [SimpleClass, ChildClass, DecoratedClass, DecoratedClass.Nested, make_local_class(), simple_function],
+)
+def test_get_source_code_matches_inspect(test_obj: Any):
+    """Test that the per-file source lookup returns exactly what inspect.getsource does."""
+    assert get_source_code(test_obj) == inspect.getsource(test_obj)
+
+
+def test_class_to_data_handles_unhashable_class():
+    """Test that unhashable classes still get their parameters and source code."""
+    result = class_to_data(UnhashableClass)
+
+    assert [param["name"] for param in result["signature"]["params"]] == ["value"]
+    assert result["source_code"] == inspect.getsource(UnhashableClass)
@@ -1,6 +1,7 @@
 """Tests for the file_to_json function."""
 
 import json
+import sys
 import types
 from typing import Any
 
@@ -48,6 +49,10 @@ def sample_function(param: str) -> str:
     return param
 
 
+# Second name bound to the same function, as in `alias = original` re-exports
+aliased_function = sample_function
+
+
 # Create a test module
 def create_test_module() -> types.ModuleType:
     """Create a test module for testing file_to_json."""
@@ -157,3 +162,30 @@ def test_file_to_json_handles_error_gracefully(monkeypatch: pytest.MonkeyPatch)
     assert "test_module" in result
     assert "Error serializing module data" in result
     assert "members: []" in result
+
+
+def test_file_to_json_emits_aliased_member_once() -> None:
+    """Test that an object bound to several names in a module is documented once."""
+    module = sys.modules[__name__]
+
+    module_data = json.loads(file_to_json(module, module.__name__))
+
+    member_names = [member["name"] for member in module_data["members"]]
+    assert member_names.count("sample_function") == 1
+
+
+@pytest.mark.parametrize(
+    "pretty,expected_prefix",
+    [
+        (False, '{"moduleName":"test_module",'),
+        (True, '{\n  "moduleName": "test_module",'),
+    ],
+)
+def test_file_to_json_output_format(
+    test_module: types.ModuleType, pretty: bool, expected_prefix: str
+) -> None:
+    """Test that file_to_json writes compact JSON unless pretty output is requested."""
+    result = file_to_json(test_module, "test_module", pretty=pretty)
+
+    assert result.startswith(expected_prefix)
+    assert json.loads(result)["moduleName"] == "test_module"
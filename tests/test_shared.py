@@ -0,0 +1,26 @@
+"""Tests for the shared package processing utilities."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from docstring2json.converter import file_to_json
+from docstring2json.utils.shared import process_package
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_package_writes_module_json(tmp_path: Path, workers: int) -> None:
+    """Test that process_package writes one data.json per module, sequentially or in parallel."""
+    process_package(
+        package_name="json",
+        output_dir=tmp_path,
+        converter_func=file_to_json,
+        workers=workers,
+    )
+
+    decoder_file = tmp_path / "json" / "decoder" / "data.json"
+    module_data = json.loads(decoder_file.read_text())
+
+    assert module_data["moduleName"] == "json.decoder"
+    assert "JSONDecoder" in [member["name"] for member in module_data["members"]]
@@ -12,6 +12,7 @@ from src.docstring2json.utils.signature_formatter import (
     _process_signature_params,
     format_default_value,
     format_signature,
+    get_signature,
     get_signature_params,
 )
 
@@ -232,6 +233,25 @@ def test_get_signature_params(test_obj: Any, expected_params: list[Parameter]) -
             assert result[i].default is not None
 
 
+def test_get_signature_params_reuses_precomputed_signature() -> None:
+    """Test that a precomputed function signature is used instead of a fresh one."""
+    def other_function(replacement: int = 1):
+        pass
+
+    result = get_signature_params(simple_function, signature=inspect.signature(other_function))
+
+    assert [param.name for param in result] == ["replacement"]
+
+
+@pytest.mark.parametrize("test_obj", [simple_function, SimpleClass])
+def test_get_signature_is_computed_once_per_object(test_obj: Any) -> None:
+    """Test that get_signature matches inspect.signature and returns the stored result on repeat calls."""
+    first = get_signature(test_obj)
+
+    assert first == inspect.signature(test_obj)
+    assert get_signature(test_obj) is first
+
+
 @pytest.mark.parametrize(
     "value,expected",
     [